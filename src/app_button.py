@@ -1,39 +1,164 @@
 import sys
 import os
+import json
 import base64
+try:
+    # SIMD-accelerated base64 (AVX2/SSSE3), ~4-10x faster than stdlib
+    import pybase64
+except ImportError:
+    pybase64 = None
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, 
                             QVBoxLayout, QHBoxLayout, QWidget, QLabel, 
                             QTextEdit, QFileDialog, QComboBox, QMessageBox)
 from PyQt5.QtGui import QFont, QPixmap, QImage
-from PyQt5.QtCore import Qt, QSize, pyqtSignal, QObject, QTimer
+from PyQt5.QtCore import (Qt, QSize, pyqtSignal, QObject, QTimer,
+                          QRunnable, QThreadPool)
 import cv2
-from gtts import gTTS
+import numpy as np
+import hashlib
 import tempfile
-import pygame
 import threading
+import queue
+import time
 import yaml
-from together import Together
-import speech_recognition as sr
+try:
+    # libyaml C backend - much faster than the pure-Python loader
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 from dotenv import load_dotenv
 
+# gtts, pygame, speech_recognition and together are imported lazily at
+# their first point of use so the window paints without waiting on them
+
+# Qt 5.14+ can consume OpenCV's BGR buffers without a colorspace conversion
+BGR888_FORMAT = getattr(QImage, "Format_BGR888", None)
+
+# Characters that close a sentence (English and Arabic) for streaming TTS
+SENTENCE_ENDINGS = ".!?؟\n"
+
+# Parsed configs by path, so reconstructing VisionDescriber doesn't reparse
+_CONFIG_CACHE = {}
+
+
+# Saved microphone calibration so only the first-ever run pays for it
+MIC_SETTINGS_PATH = os.path.join(os.path.expanduser("~"), ".visionpal", "mic.json")
+
+_mixer_ready = False
+
+
+def _get_pygame():
+    """Import pygame on first use and make sure the mixer is initialized."""
+    global _mixer_ready
+    import pygame
+    if not _mixer_ready:
+        pygame.mixer.init()
+        _mixer_ready = True
+    return pygame
+
+
+def open_camera(index=0):
+    """Open a capture device with an explicit backend and a small frame size.
+
+    The default backend (MSMF on Windows) can take seconds to initialize,
+    and the native sensor resolution wastes bandwidth on a ~900px preview.
+    Requesting 640x480 with a single-frame buffer keeps the preview fresh.
+    """
+    if sys.platform.startswith("win"):
+        cap = cv2.VideoCapture(index, cv2.CAP_DSHOW)
+    elif sys.platform.startswith("linux"):
+        cap = cv2.VideoCapture(index, cv2.CAP_V4L2)
+    else:
+        cap = cv2.VideoCapture(index)
+
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return cap
+
 class VisionDescriber:
+    # Keep a handful of encoded images around so repeat prompts against the
+    # same image ("Ask Another Question") skip the disk read + base64 pass.
+    ENCODE_CACHE_SIZE = 8
+
+    # Completed descriptions keyed by (image, prompt, model) hash: an exact
+    # repeat returns instantly instead of re-running the vision model
+    DESCRIPTION_CACHE_SIZE = 64
+
     def __init__(self, config_path="Configs/config.yml"):
         load_dotenv()
         self.config = self._load_config(config_path)
         api_key = os.getenv("TOGETHER_API_KEY")
         if not api_key or api_key == "YOUR_TOGETHER_API_KEY_HERE":
             raise ValueError("TOGETHER_API_KEY not found or not set in .env file.")
-        self.client = Together(api_key=api_key)
+        self.client = self._build_client(api_key)
+        self._encode_cache = {}
+        self._description_cache = {}
+
+        # Establish the TLS session before the first capture so the first
+        # request doesn't pay the handshake
+        threading.Thread(target=self._warm_up_connection, daemon=True).start()
+
+    def _build_client(self, api_key):
+        """Build the Together client on a pooled HTTP/2 session if possible."""
+        from together import Together
+        try:
+            import httpx
+            http_client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+            return Together(api_key=api_key, http_client=http_client)
+        except (ImportError, TypeError):
+            # Older SDK without http_client support, or httpx/h2 missing
+            return Together(api_key=api_key)
+
+    def _warm_up_connection(self):
+        """Fire a tiny request to warm up DNS + TLS in the background."""
+        try:
+            self.client.models.list()
+        except Exception:
+            pass
 
     def encode_image(self, image_path):
+        """Return the base64 data URL for an image, cached by (path, mtime, size)."""
+        stat = os.stat(image_path)
+        cache_key = (image_path, stat.st_mtime_ns, stat.st_size)
+        data_url = self._encode_cache.get(cache_key)
+        if data_url is not None:
+            return data_url
+
         with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+            raw = image_file.read()
+
+        if pybase64 is not None:
+            encoded = pybase64.b64encode_as_string(raw)
+        else:
+            encoded = base64.b64encode(raw).decode('ascii')
+        data_url = f"data:image/jpeg;base64,{encoded}"
+
+        # Evict the oldest entry once the cache is full (insertion order)
+        if len(self._encode_cache) >= self.ENCODE_CACHE_SIZE:
+            self._encode_cache.pop(next(iter(self._encode_cache)))
+        self._encode_cache[cache_key] = data_url
+        return data_url
+
+    def encode_image_bytes(self, jpeg_bytes):
+        """Return the base64 data URL for in-memory JPEG bytes (no file I/O)."""
+        if pybase64 is not None:
+            encoded = pybase64.b64encode_as_string(jpeg_bytes)
+        else:
+            encoded = base64.b64encode(jpeg_bytes).decode('ascii')
+        return f"data:image/jpeg;base64,{encoded}"
 
     def _load_config(self, config_path):
-        """Loads the configuration from the YAML file."""
+        """Loads the configuration from the YAML file (cached per path)."""
+        if config_path in _CONFIG_CACHE:
+            return _CONFIG_CACHE[config_path]
         try:
             with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YamlLoader)
+            _CONFIG_CACHE[config_path] = config
             return config
         except FileNotFoundError:
             print(f"Error: config.yml not found at {config_path}")
@@ -42,22 +167,63 @@ class VisionDescriber:
             print(f"Error parsing config.yml: {e}")
             return None
 
-    def get_description(self, imagePath, system_prompt=None):
+    def get_description(self, imagePath, system_prompt=None, image_bytes=None):
         """
         Gets a description of an image using the Together AI Vision model.
 
         Args:
-            image_url (str): URL of the image to describe.
-            user_prompt (str, optional): Additional user prompt. Defaults to None.
+            imagePath (str): Path of the image to describe.
+            system_prompt (str, optional): Additional user prompt. Defaults to None.
+            image_bytes (bytes, optional): In-memory JPEG bytes; when given the
+                file at imagePath is not read at all.
 
         Returns:
             str: The description of the image, or None if an error occurs.
         """
+        chunks = self.get_description_stream(imagePath, system_prompt, image_bytes)
+        if chunks is None:
+            return None
+        return "".join(chunks)
+
+    def get_description_stream(self, imagePath, system_prompt=None, image_bytes=None):
+        """Yield the description as raw text chunks while tokens stream in."""
         if self.config is None:
             return None
 
-        base64_image = self.encode_image(imagePath)
-        
+        if image_bytes is not None:
+            image_url = self.encode_image_bytes(image_bytes)
+        else:
+            image_url = self.encode_image(imagePath)
+
+        # The data URL embeds the image content, so hashing it together with
+        # the prompt and model uniquely identifies the request
+        model = self.config["VisionPal"]["model"]
+        cache_key = hashlib.sha256(
+            (image_url + (system_prompt or "") + model).encode()).hexdigest()
+        cached = self._description_cache.get(cache_key)
+        if cached is not None:
+            # Refresh LRU position and replay the stored description
+            self._description_cache.pop(cache_key)
+            self._description_cache[cache_key] = cached
+            return iter([cached])
+
+        return self._stream_and_cache(image_url, system_prompt, cache_key)
+
+    def _stream_and_cache(self, image_url, system_prompt, cache_key):
+        """Stream the completion, caching the full text once it finishes."""
+        parts = []
+        for chunk_text in self._stream_completion(image_url, system_prompt):
+            parts.append(chunk_text)
+            yield chunk_text
+
+        description = "".join(parts)
+        if description:
+            if len(self._description_cache) >= self.DESCRIPTION_CACHE_SIZE:
+                self._description_cache.pop(next(iter(self._description_cache)))
+            self._description_cache[cache_key] = description
+
+    def _stream_completion(self, image_url, system_prompt):
+        """Generator over text chunks from the Together streaming completion."""
         stream = self.client.chat.completions.create(
             model=self.config["VisionPal"]["model"],
             messages=[
@@ -68,7 +234,7 @@ class VisionDescriber:
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/jpeg;base64,{base64_image}",
+                                "url": image_url,
                             },
                         },
                     ],
@@ -77,20 +243,30 @@ class VisionDescriber:
             stream=True,
         )
         
-        description = ""
         for chunk in stream:
-            chunk_text = chunk.choices[0].delta.content or "" if chunk.choices else ""
-            description += chunk_text
-            
-        return description
+            choices = chunk.choices
+            if choices:
+                yield choices[0].delta.content or ""
+
+class Worker(QRunnable):
+    """Run a plain callable on the shared thread pool."""
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        self.fn(*self.args)
 
 class WorkerSignals(QObject):
     """Define signals for worker thread communication."""
     result = pyqtSignal(str)
+    partial = pyqtSignal(str)
     error = pyqtSignal(str)
     finished = pyqtSignal()
     speech_recognized = pyqtSignal(str)
     frame_ready = pyqtSignal(QImage)
+    audio_ready = pyqtSignal(str)
 
 class VisionPalApp(QMainWindow):
     def __init__(self):
@@ -101,12 +277,14 @@ class VisionPalApp(QMainWindow):
         # Initialize the Vision Describer
         self.vision_describer = self.init_vision_describer()
         
-        # Store the current image path
+        # Store the current image path (and, for captures, the JPEG bytes)
         self.current_image_path = None
+        self.current_image_bytes = None
         
         # Camera variables
         self.camera_active = False
         self.cap = None
+        self._rgb_buf = None  # reusable BGR->RGB buffer for old-Qt fallback
         self.camera_timer = QTimer()
         self.camera_timer.timeout.connect(self.update_camera_frame)
         
@@ -117,23 +295,51 @@ class VisionPalApp(QMainWindow):
         }
         self.current_language = "English"
 
+        # Bounded pool for one-shot background work (listen, vision calls);
+        # unbounded daemon threads pile up under rapid clicking
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(3)
+
         # Initialize the UI
         self.init_ui()
-        
+        self._preview_size = self.image_preview.size()
+
         # Set up signal handler
         self.worker_signals = WorkerSignals()
         self.worker_signals.result.connect(self.update_description)
+        self.worker_signals.partial.connect(self.update_partial_description)
         self.worker_signals.error.connect(self.update_error)
         self.worker_signals.speech_recognized.connect(self.update_prompt)
         self.worker_signals.frame_ready.connect(self.display_camera_frame)
+        self.worker_signals.audio_ready.connect(self.play_audio_file)
         
-        # Initialize pygame for audio playback
-        pygame.mixer.init()
+        # pygame's mixer is initialized lazily on the first playback
         self.is_playing_audio = False  # Add this line
+        self.current_audio_path = None
+
+        # Lightweight poll for end of playback (replaces the fixed-delay
+        # cleanup guess, which leaked files for long descriptions)
+        self.playback_timer = QTimer()
+        self.playback_timer.setInterval(100)
+        self.playback_timer.timeout.connect(self.check_playback_finished)
+
+        # Synthesized speech cache: (text, lang) hash -> mp3 path. Repeated
+        # descriptions skip the gTTS network round-trip entirely.
+        self.tts_cache = {}
+        self.tts_cache_size = 32
+
+        # Sentence queue feeding a persistent TTS worker: the first sentence
+        # starts playing while later tokens are still streaming in
+        self.tts_queue = queue.Queue()
+        self._first_partial = True
+        self._offline_tts_engine = None
+        threading.Thread(target=self._tts_worker_loop, daemon=True).start()
+
+        # Speech recognizer is created on the first listen; ambient-noise
+        # calibration also runs once instead of delaying every recognition
+        self.recognizer = None
+        self._mic_calibrated = False
 
-        # Initialize speech recognizer
-        self.recognizer = sr.Recognizer()
-        
     def init_vision_describer(self):
         """Initialize the Vision Describer."""
         try:
@@ -326,6 +532,11 @@ class VisionPalApp(QMainWindow):
         
         main_layout.addLayout(control_buttons)
         
+        # Settings menu
+        settings_menu = self.menuBar().addMenu("Settings")
+        recalibrate_action = settings_menu.addAction("Recalibrate Mic")
+        recalibrate_action.triggered.connect(self.recalibrate_mic)
+
         # Status bar for messages
         self.statusBar().showMessage("Ready")
 
@@ -380,16 +591,18 @@ class VisionPalApp(QMainWindow):
     def start_camera(self):
         """Start the camera and preview."""
         try:
-            self.cap = cv2.VideoCapture(0)
+            self.cap = open_camera()
             if not self.cap.isOpened():
                 self.statusBar().showMessage("Error: Could not open camera.")
                 return
-                
+
             self.camera_active = True
             self.camera_btn.setText("Stop Camera")
             self.capture_btn.setEnabled(True)
             self.gallery_btn.setEnabled(False)
-            self.camera_timer.start(30)  # Update every 30ms (approx 33 fps)
+            # Cache the preview size so every frame doesn't query the widget
+            self._preview_size = self.image_preview.size()
+            self.camera_timer.start(66)  # Update every 66ms (approx 15 fps)
             self.statusBar().showMessage("Camera active. Adjust and click 'Capture' when ready.")
             
         except Exception as e:
@@ -413,23 +626,41 @@ class VisionPalApp(QMainWindow):
         if self.cap and self.cap.isOpened():
             ret, frame = self.cap.read()
             if ret:
-                # Convert frame to QImage for display
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = frame_rgb.shape
+                h, w, ch = frame.shape
                 bytes_per_line = ch * w
-                q_image = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
-                self.worker_signals.frame_ready.emit(q_image)
+                if BGR888_FORMAT is not None:
+                    # Wrap the OpenCV BGR buffer directly - no cvtColor pass
+                    # or extra allocation. copy() detaches from the frame
+                    # buffer so the image survives the signal emit.
+                    q_image = QImage(frame.data, w, h, bytes_per_line,
+                                     BGR888_FORMAT).copy()
+                else:
+                    # Older Qt5 without Format_BGR888: swap channels into a
+                    # preallocated buffer so no malloc happens per frame
+                    if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+                        self._rgb_buf = np.empty_like(frame)
+                    cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+                    q_image = QImage(self._rgb_buf.data, w, h, bytes_per_line,
+                                     QImage.Format_RGB888).copy()
+                # Scale here (QImage + fast filter) so the UI thread only
+                # has to wrap the already-sized image in a pixmap
+                q_small = q_image.scaled(
+                    self._preview_size.width(),
+                    self._preview_size.height(),
+                    Qt.KeepAspectRatio,
+                    Qt.FastTransformation
+                )
+                self.worker_signals.frame_ready.emit(q_small)
     
     def display_camera_frame(self, q_image):
-        """Display camera frame in UI."""
-        # Scale image to fit the label while maintaining aspect ratio
-        scaled_pixmap = QPixmap.fromImage(q_image).scaled(
-            self.image_preview.width(), 
-            self.image_preview.height(),
-            Qt.KeepAspectRatio, 
-            Qt.SmoothTransformation
-        )
-        self.image_preview.setPixmap(scaled_pixmap)
+        """Display an already-scaled camera frame in the UI."""
+        self.image_preview.setPixmap(QPixmap.fromImage(q_image))
+
+    def resizeEvent(self, event):
+        """Keep the cached preview size in sync with the window."""
+        super().resizeEvent(event)
+        if hasattr(self, "image_preview"):
+            self._preview_size = self.image_preview.size()
     
     def capture_image(self):
         """Capture current camera frame."""
@@ -442,13 +673,34 @@ class VisionPalApp(QMainWindow):
             self.statusBar().showMessage("Failed to capture image.")
             return
             
-        # Save the captured image to a temporary file
+        # Downscale and re-encode at a lower quality before upload: the
+        # payload is shipped base64-encoded over HTTPS, so fewer bytes cut
+        # both the encoding work and the upload latency.
+        h, w = frame.shape[:2]
+        if max(h, w) > 1024:
+            scale = 1024 / max(h, w)
+            frame = cv2.resize(frame, (int(w * scale), int(h * scale)),
+                               interpolation=cv2.INTER_AREA)
+
+        # Encode once in memory; the frame never needs to cross the
+        # filesystem to reach the API
+        ok, buf = cv2.imencode(
+            '.jpg', frame,
+            [cv2.IMWRITE_JPEG_QUALITY, 75, cv2.IMWRITE_JPEG_OPTIMIZE, 1])
+        if not ok:
+            self.statusBar().showMessage("Failed to encode captured image.")
+            return
+        jpeg_bytes = buf.tobytes()
+
+        # Save a copy to a temporary file only for the preview widget
         temp_dir = tempfile.gettempdir()
         temp_file = os.path.join(temp_dir, "visionpal_capture.jpg")
-        cv2.imwrite(temp_file, frame)
-        
-        # Store the current image path
+        with open(temp_file, "wb") as f:
+            f.write(jpeg_bytes)
+
+        # Store the current image path and bytes
         self.current_image_path = temp_file
+        self.current_image_bytes = jpeg_bytes
         self.prompt_text.clear()  # Clear spoken prompt box
 
         # Enable the microphone button
@@ -475,8 +727,9 @@ class VisionPalApp(QMainWindow):
         if image_path:
             self.display_image(image_path)
             
-            # Store the current image path
+            # Store the current image path (gallery images stay file-based)
             self.current_image_path = image_path
+            self.current_image_bytes = None
             self.prompt_text.clear()  # Clear spoken prompt box
 
             # Enable the microphone button
@@ -508,29 +761,36 @@ class VisionPalApp(QMainWindow):
         self.mic_btn.setText("🎤 Listening...")
         self.mic_btn.setEnabled(False)
         
-        # Run in a separate thread to prevent UI freezing
-        threading.Thread(
-            target=self._listen_thread,
-            daemon=True
-        ).start()
+        # Run on the shared pool to prevent UI freezing
+        self.pool.start(Worker(self._listen_thread))
     
     def _listen_thread(self):
         """Background thread for speech recognition."""
+        import speech_recognition as sr
+        if self.recognizer is None:
+            self.recognizer = sr.Recognizer()
+            saved_threshold = self._load_mic_calibration()
+            if saved_threshold is not None:
+                self.recognizer.energy_threshold = saved_threshold
+                self.recognizer.dynamic_energy_threshold = False
+                self._mic_calibrated = True
         try:
             with sr.Microphone() as source:
-                self.recognizer.adjust_for_ambient_noise(source)
+                if not self._mic_calibrated:
+                    self.recognizer.adjust_for_ambient_noise(source)
+                    self._mic_calibrated = True
+                    self._save_mic_calibration(self.recognizer.energy_threshold)
                 audio = self.recognizer.listen(source, timeout=5)
-                
+
             # Get the language code for speech recognition
             lang_code = self.available_languages[self.current_language]["code"]
-            
+
             # Use the appropriate language for recognition
             # Note: Google Speech Recognition supports limited languages
             # For Arabic, use "ar-AR" or "ar"
             recognize_lang = "ar-AR" if lang_code == "ar" else "en-US"
-            
-            # Recognize speech using Google Speech Recognition
-            text = self.recognizer.recognize_google(audio, language=recognize_lang)
+
+            text = self._recognize_audio(audio, recognize_lang)
             self.worker_signals.speech_recognized.emit(text)
             
         except sr.WaitTimeoutError:
@@ -545,6 +805,50 @@ class VisionPalApp(QMainWindow):
         # Re-enable the microphone button
         self.mic_btn.setText("🎤 Speak Prompt")
         self.mic_btn.setEnabled(True)
+
+    def _load_mic_calibration(self):
+        """Load the persisted mic energy threshold, if any."""
+        try:
+            with open(MIC_SETTINGS_PATH, "r") as f:
+                return json.load(f)["energy_threshold"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _save_mic_calibration(self, energy_threshold):
+        """Persist the mic energy threshold for the next launch."""
+        try:
+            os.makedirs(os.path.dirname(MIC_SETTINGS_PATH), exist_ok=True)
+            with open(MIC_SETTINGS_PATH, "w") as f:
+                json.dump({"energy_threshold": energy_threshold}, f)
+        except OSError:
+            pass
+
+    def recalibrate_mic(self):
+        """Drop the saved calibration so the next listen re-measures noise."""
+        self._mic_calibrated = False
+        if self.recognizer is not None:
+            self.recognizer.dynamic_energy_threshold = True
+        try:
+            os.unlink(MIC_SETTINGS_PATH)
+        except OSError:
+            pass
+        self.statusBar().showMessage("Microphone will recalibrate on next listen.")
+
+    def _recognize_audio(self, audio, recognize_lang):
+        """Recognize speech, using offline Vosk when the config asks for it."""
+        stt_engine = None
+        if self.vision_describer and self.vision_describer.config:
+            stt_engine = self.vision_describer.config["VisionPal"].get("stt_engine")
+
+        if stt_engine == "vosk":
+            try:
+                # Local quantized model: returns in tens of ms, no network
+                result = self.recognizer.recognize_vosk(audio)
+                return json.loads(result).get("text", "")
+            except Exception as e:
+                print(f"Vosk recognition failed, falling back to Google: {e}")
+
+        return self.recognizer.recognize_google(audio, language=recognize_lang)
     
     def update_prompt(self, text):
         """Update the prompt text box with recognized speech."""
@@ -573,45 +877,90 @@ class VisionPalApp(QMainWindow):
         
         if not custom_prompt:
             custom_prompt = self.available_languages[self.current_language]["default_prompt"]
-        
-        # Run in a separate thread to prevent UI freezing
-        threading.Thread(
-            target=self._process_image_thread,
-            args=(image_path, custom_prompt),
-            daemon=True
-        ).start()
+
+        self._first_partial = True
+
+        # Run on the shared pool to prevent UI freezing
+        self.pool.start(Worker(self._process_image_thread, image_path, custom_prompt))
     
     def _process_image_thread(self, image_path, custom_prompt):
-        """Background thread for image processing."""
+        """Background thread for image processing.
+
+        Streams the description sentence-by-sentence: each completed
+        sentence is shown immediately and queued for TTS, so the first
+        audio plays while later tokens are still being generated.
+        """
         try:
             if not self.vision_describer:
                 raise Exception("Vision Describer is not initialized")
-                
-            # Get image description
-            description = self.vision_describer.get_description(image_path, custom_prompt)
-            
+
+            lang_code = self.available_languages[self.current_language]["code"]
+            chunks = self.vision_describer.get_description_stream(
+                image_path, custom_prompt, image_bytes=self.current_image_bytes)
+
+            parts = []
+            buffer = ""
+            if chunks is not None:
+                for chunk_text in chunks:
+                    buffer += chunk_text
+                    buffer = self._flush_sentences(buffer, parts, lang_code)
+
+            # Flush whatever remains after the stream closes
+            if buffer:
+                parts.append(buffer)
+                self.worker_signals.partial.emit(buffer)
+                if buffer.strip():
+                    self.tts_queue.put((buffer.strip(), lang_code))
+
+            description = "".join(parts)
             if not description:
                 description = "Could not generate description for this image."
-            
-            # Send the result to the main thread using signals
+                self.tts_queue.put((description, lang_code))
+
+            # Send the full result to the main thread using signals
             self.worker_signals.result.emit(description)
-            
+
         except Exception as e:
             error_msg = f"Error processing image: {str(e)}"
             self.worker_signals.error.emit(error_msg)
+
+    def _flush_sentences(self, buffer, parts, lang_code):
+        """Emit and enqueue every complete sentence in buffer; return the rest."""
+        while True:
+            cut = None
+            for i, ch in enumerate(buffer):
+                if ch in SENTENCE_ENDINGS:
+                    cut = i + 1
+                    break
+            if cut is None:
+                return buffer
+            sentence = buffer[:cut]
+            buffer = buffer[cut:]
+            parts.append(sentence)
+            self.worker_signals.partial.emit(sentence)
+            if sentence.strip():
+                self.tts_queue.put((sentence.strip(), lang_code))
     
+    def update_partial_description(self, sentence):
+        """Append a streamed sentence to the description as it arrives."""
+        if self._first_partial:
+            self.description_text.setPlainText(sentence)
+            self._first_partial = False
+        else:
+            cursor = self.description_text.textCursor()
+            cursor.movePosition(cursor.End)
+            cursor.insertText(sentence)
+
     def update_description(self, description):
-        """Update UI with the image description."""
+        """Update UI with the full image description."""
         self.description_text.setText(description)
         self.statusBar().showMessage("Analysis complete.")
-        
-        # Enable control buttons
+
+        # Enable control buttons (speech was already queued sentence-by-
+        # sentence while the description streamed in)
         self.stop_btn.setEnabled(True)
         self.ask_again_btn.setEnabled(True)
-        
-        # Read description aloud
-        self.speak_text(description)
-        
+
     def update_error(self, error_msg):
         """Update UI with error message. This runs in the main thread."""
         self.description_text.setText(error_msg)
@@ -619,56 +968,178 @@ class VisionPalApp(QMainWindow):
         self.mic_btn.setEnabled(True)
         
     def speak_text(self, text):
-        """Convert text to speech and play it."""
+        """Queue text for speech synthesis and playback."""
+        lang_code = self.available_languages[self.current_language]["code"]
+        self.tts_queue.put((text, lang_code))
+
+    def _tts_worker_loop(self):
+        """Persistent worker: synthesize queued sentences and play in order."""
+        while True:
+            text, lang_code = self.tts_queue.get()
+
+            # Short English prompts (and forced-offline configs) go to the
+            # local engine: synthesis starts in well under 100ms, vs a full
+            # gTTS round trip. Long descriptions keep the gTTS voice quality.
+            if self._use_offline_tts(text, lang_code) and self._speak_offline(text):
+                continue
+
+            audio_path = self._synthesize_to_file(text, lang_code)
+            if audio_path is None:
+                continue
+            pygame = _get_pygame()
+
+            # Wait for the previous clip to finish so sentences don't overlap
+            while self.is_playing_audio or pygame.mixer.music.get_busy():
+                time.sleep(0.05)
+
+            self.worker_signals.audio_ready.emit(audio_path)
+
+            # Give the UI thread a moment to start playback before the next
+            # busy check, otherwise back-to-back sentences could race
+            deadline = time.time() + 2.0
+            while not self.is_playing_audio and time.time() < deadline:
+                time.sleep(0.02)
+
+    def _use_offline_tts(self, text, lang_code):
+        """Decide whether this utterance should use the local TTS engine."""
+        tts_engine = None
+        if self.vision_describer and self.vision_describer.config:
+            tts_engine = self.vision_describer.config["VisionPal"].get("tts_engine")
+        if tts_engine == "offline":
+            return True
+        return lang_code == "en" and len(text) < 120
+
+    def _speak_offline(self, text):
+        """Speak through pyttsx3 locally; returns False if unavailable."""
         try:
-            # Create a uniquely named temporary file
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp_file:
-                temp_path = tmp_file.name
-            
-            # Get the language code
-            lang_code = self.available_languages[self.current_language]["code"]
-            
+            import pyttsx3
+        except ImportError:
+            return False
+        try:
+            if self._offline_tts_engine is None:
+                self._offline_tts_engine = pyttsx3.init()
+
+            # Keep utterances ordered behind any gTTS clip still playing
+            if _mixer_ready:
+                pygame = _get_pygame()
+                while self.is_playing_audio or pygame.mixer.music.get_busy():
+                    time.sleep(0.05)
+
+            self._offline_tts_engine.say(text)
+            self._offline_tts_engine.runAndWait()
+            return True
+        except Exception:
+            return False
+
+    def _synthesize_to_file(self, text, lang_code):
+        """Synthesize text to an mp3 (cached) and return the file path."""
+        cache_key = hashlib.blake2b(
+            text.encode() + lang_code.encode(), digest_size=16).hexdigest()
+
+        # Cache hit: skip gTTS entirely and reuse the stored file
+        cached_path = self.tts_cache.get(cache_key)
+        if cached_path and os.path.exists(cached_path):
+            # Refresh LRU position
+            self.tts_cache.pop(cache_key)
+            self.tts_cache[cache_key] = cached_path
+            return cached_path
+
+        try:
+            # Deterministic per-process path: no mkstemp syscall per call,
+            # and everything is easy to sweep up on exit
+            temp_path = os.path.join(
+                tempfile.gettempdir(),
+                f'visionpal_tts_{os.getpid()}_{cache_key}.mp3')
+
             # Generate speech
+            from gtts import gTTS
             tts = gTTS(text=text, lang=lang_code, slow=False)
             tts.save(temp_path)
-            
-            # Play the audio
-            pygame.mixer.music.load(temp_path)
+
+            # Insert into the cache, evicting the least recently used file
+            if len(self.tts_cache) >= self.tts_cache_size:
+                evicted_key = next(iter(self.tts_cache))
+                self.cleanup_temp_file(self.tts_cache.pop(evicted_key))
+            self.tts_cache[cache_key] = temp_path
+            return temp_path
+
+        except Exception as e:
+            self.worker_signals.error.emit(f"Speech error: {str(e)}")
+            return None
+
+    def play_audio_file(self, audio_path):
+        """Play a synthesized audio file and track playback state."""
+        try:
+            pygame = _get_pygame()
+            pygame.mixer.music.load(audio_path)
             pygame.mixer.music.play()
-            
-            # Update playback state
+
+            # Update playback state and watch for the end of playback
             self.is_playing_audio = True
-            
-            # Set up a timer to delete the file after playback completes
-            QTimer.singleShot(10000, lambda: self.cleanup_after_playback(temp_path))
-            
+            self.current_audio_path = audio_path
+            self.playback_timer.start()
+
         except Exception as e:
             self.statusBar().showMessage(f"Speech error: {str(e)}")
 
+    def check_playback_finished(self):
+        """Clean up as soon as the current clip actually finishes playing."""
+        pygame = _get_pygame()
+        if not pygame.mixer.music.get_busy():
+            self.playback_timer.stop()
+            self.cleanup_after_playback(self.current_audio_path)
+
     def cleanup_temp_file(self, file_path):
         """Clean up temporary audio file."""
         try:
+            if file_path == self.current_audio_path:
+                # Release the mixer's handle so the unlink succeeds
+                _get_pygame().mixer.music.unload()
             if os.path.exists(file_path):
                 os.unlink(file_path)
         except:
             pass
+
+    def closeEvent(self, event):
+        """Delete every cached TTS file on application exit."""
+        try:
+            if _mixer_ready:
+                pygame = _get_pygame()
+                pygame.mixer.music.stop()
+                pygame.mixer.music.unload()
+        except Exception:
+            pass
+        for path in self.tts_cache.values():
+            try:
+                if os.path.exists(path):
+                    os.unlink(path)
+            except OSError:
+                pass
+        super().closeEvent(event)
     
     def stop_playback(self):
-        """Stop current audio playback."""
+        """Stop current audio playback and drop any queued sentences."""
+        while not self.tts_queue.empty():
+            try:
+                self.tts_queue.get_nowait()
+            except queue.Empty:
+                break
         if self.is_playing_audio:
-            pygame.mixer.music.stop()
-            self.is_playing_audio = False
+            _get_pygame().mixer.music.stop()
+            self.playback_timer.stop()
+            self.cleanup_after_playback(self.current_audio_path)
             self.statusBar().showMessage("Playback stopped")
             self.ask_again_btn.setEnabled(True)  # Enable ask again button
-            
+
     def cleanup_after_playback(self, file_path):
         """Clean up after playback finishes or is stopped."""
-        try:
-            if os.path.exists(file_path):
-                os.unlink(file_path)
-        except:
-            pass
-        self.is_playing_audio = False
+        # Cached files stay on disk for reuse; they are removed on eviction
+        if file_path and file_path not in self.tts_cache.values():
+            self.cleanup_temp_file(file_path)
+        # Only clear the flag if a newer clip hasn't taken over the mixer
+        if file_path == self.current_audio_path:
+            self.is_playing_audio = False
+            self.current_audio_path = None
 
 def create_config_directory():
     """Create the Configs directory and default config file if they don't exist."""
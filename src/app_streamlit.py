@@ -1,38 +1,195 @@
 import streamlit as st
 import base64
-import requests
+try:
+    # SIMD-accelerated base64 (AVX2/SSSE3), ~4-10x faster than stdlib
+    import pybase64
+except ImportError:
+    pybase64 = None
 import os
 from PIL import Image
 import io
-import time
-import speech_recognition as sr
-import pyttsx3
-import tempfile
+import functools
+import hashlib
+import pickle
+import sqlite3
 import yaml
-from together import Together
+try:
+    # libyaml C backend - much faster than the pure-Python loader
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 import threading
+import queue
 from dotenv import load_dotenv
 
+# pyttsx3, speech_recognition and together are imported lazily inside the
+# cached resource builders: they pull in pywin32/PyAudio/httpx+pydantic and
+# would otherwise tax every single Streamlit rerun
+
+
+def shrink_image(image_bytes, max_side=896, quality=85):
+    """Downscale and JPEG-recompress an image before base64 + upload.
+
+    Camera input is often a full-resolution PNG that the vision model
+    downsamples server-side anyway; 896px keeps 2x margin over the model's
+    448px input while cutting upload bytes by an order of magnitude.
+    """
+    img = Image.open(io.BytesIO(image_bytes))
+    if max(img.size) <= max_side and img.format == 'JPEG':
+        return image_bytes
+    img.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+    buf = io.BytesIO()
+    img.convert('RGB').save(buf, 'JPEG', quality=quality, optimize=True)
+    return buf.getvalue()
+
+
+def encode_image_b64(image_bytes):
+    """Base64-encode image bytes, using SIMD pybase64 when installed."""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(image_bytes)
+    return base64.b64encode(image_bytes).decode('ascii')
+
+
+# Static markup built once at import; the rerun-time calls just hand the
+# same string to st.markdown
+_TITLE_HTML = """
+    <h1 style='text-align: center;'>
+        <span style="color: #FF5733;">V</span><span style="color: #FFBD33;">i</span><span style="color: #DBFF33;">s</span><span style="color: #75FF33;">i</span><span style="color: #33FF57;">o</span><span style="color: #33FFBD;">n</span>
+        <span style="color: #33DBFF;">P</span><span style="color: #3375FF;">a</span><span style="color: #5733FF;">l</span>
+        <img src="https://img.icons8.com/ios-filled/50/visible.png" width="35" style="vertical-align: middle;"/>
+    </h1>
+"""
+_SPEAKING_HTML = "<p style='text-align:center;'>🔊 Speaking...</p>"
+_LISTENING_HTML = "<p style='text-align:center; animation: pulse 1s infinite;'>🎤 Listening...</p>"
+
+
+# Completed descriptions keyed by (image hash, normalized prompt): sessions
+# often repeat the same question about the same scene, and an exact hit
+# returns in microseconds instead of a 1-3s vision round trip
+_DESCRIPTION_CACHE_SIZE = 64
+
+@st.cache_resource
+def get_description_cache():
+    return {}
+
+@st.cache_resource
+def get_description_db():
+    """Open the on-disk description cache, creating it on first use.
+
+    The in-memory LRU dies whenever the server reloads; this tiny SQLite
+    table keeps finished descriptions across restarts, so a repeat of the
+    same image + question skips the multi-second vision call entirely.
+    WAL + synchronous=NORMAL keep single-row writes off the fsync path.
+    """
+    os.makedirs("cache", exist_ok=True)
+    conn = sqlite3.connect("cache/desc.db", isolation_level=None,
+                           check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS d(k BLOB PRIMARY KEY, v TEXT)")
+    return conn
+
+def _description_db_key(img_hash, prompt, lang):
+    """16-byte blake2b over image hash, prompt and language."""
+    return hashlib.blake2b(
+        img_hash.encode() + b"\x00" + prompt.strip().lower().encode() +
+        b"\x00" + lang.encode(),
+        digest_size=16).digest()
+
+def cached_description(img_hash, prompt, lang):
+    """Return the cached description for (image, prompt, lang), or None."""
+    cache = get_description_cache()
+    # lang is part of the key, matching the SQLite key below: the same
+    # question in another language is a different description
+    key = (img_hash, prompt.strip().lower(), lang)
+    value = cache.get(key)
+    if value is not None:
+        # Refresh LRU position
+        cache.pop(key)
+        cache[key] = value
+        return value
+    # Fall back to the persistent cache and warm the in-memory one
+    row = get_description_db().execute(
+        "SELECT v FROM d WHERE k = ?",
+        (_description_db_key(img_hash, prompt, lang),)).fetchone()
+    if row is not None:
+        if len(cache) >= _DESCRIPTION_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = row[0]
+        return row[0]
+    return None
+
+def store_description(img_hash, prompt, description, lang):
+    """Insert a finished description, evicting the least recently used."""
+    if not description:
+        return
+    cache = get_description_cache()
+    if len(cache) >= _DESCRIPTION_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    cache[(img_hash, prompt.strip().lower(), lang)] = description
+    try:
+        get_description_db().execute(
+            "INSERT OR REPLACE INTO d VALUES (?, ?)",
+            (_description_db_key(img_hash, prompt, lang), description))
+    except sqlite3.Error:
+        # A broken disk cache should never take down the answer path
+        pass
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path, mtime):
+    """Parse the YAML config, memoized by (path, mtime).
+
+    Streamlit reruns the whole script on every widget interaction; keying
+    on the mtime means edits to the file invalidate the cache while
+    ordinary reruns hit a dict lookup instead of disk + parse.
+
+    A pickled sidecar (config.pkl) skips the YAML tokenizer entirely on
+    fresh processes: unpickling a small dict is 10-100x faster than even
+    the libyaml parse, and the mtime comparison keeps it honest when the
+    YAML is edited.
+    """
+    pkl_path = os.path.splitext(config_path)[0] + ".pkl"
+    try:
+        if os.path.getmtime(pkl_path) >= mtime:
+            with open(pkl_path, "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    with open(config_path, "r") as f:
+        config = yaml.load(f, Loader=YamlLoader)
+    try:
+        with open(pkl_path, "wb") as f:
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        # Read-only deployments just keep paying the YAML parse
+        pass
+    return config
+
 class VisionDescriber:
-    def __init__(self, config_path="Configs/config.yml"):
-        load_dotenv()
+    def __init__(self, api_key, config_path="Configs/config.yml"):
         self.config = self._load_config(config_path)
-        api_key = os.getenv("TOGETHER_API_KEY")
-        if not api_key or api_key == "YOUR_TOGETHER_API_KEY_HERE":
-            st.error("`TOGETHER_API_KEY` not found or not set. Please create a `.env` file in the project root and add `TOGETHER_API_KEY='your_key_here'`.")
-            st.stop()
-        self.client = Together(api_key=api_key)
+        self.client = self._build_client(api_key)
 
-    def encode_image(self, image_path):
-        with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+    def _build_client(self, api_key):
+        """Build the Together client on a pooled HTTP/2 session if possible."""
+        from together import Together
+        try:
+            import httpx
+            http_client = httpx.Client(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+            return Together(api_key=api_key, http_client=http_client)
+        except (ImportError, TypeError):
+            # Older SDK without http_client support, or httpx/h2 missing
+            return Together(api_key=api_key)
 
     def _load_config(self, config_path):
-        """Loads the configuration from the YAML file."""
+        """Loads the configuration from the YAML file (memoized by mtime)."""
         try:
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
-            return config
+            return _load_config_cached(config_path, os.path.getmtime(config_path))
         except FileNotFoundError:
             print(f"Error: config.yml not found at {config_path}")
             return None
@@ -40,22 +197,34 @@ class VisionDescriber:
             print(f"Error parsing config.yml: {e}")
             return None
 
-    def get_description(self, imagePath, system_prompt=None):
+    def get_description(self, image_url, system_prompt=None):
         """
         Gets a description of an image using the Together AI Vision model.
 
         Args:
-            image_url (str): URL of the image to describe.
-            user_prompt (str, optional): Additional user prompt. Defaults to None.
+            image_url (str): data URL of the JPEG to describe. Built once
+                per session (the megabyte-scale copy) and reused across
+                follow-up questions; the describer itself is a
+                cross-session singleton and keeps no per-image state.
+            system_prompt (str, optional): Additional user prompt. Defaults to None.
 
         Returns:
             str: The description of the image, or None if an error occurs.
         """
+        chunks = self.get_description_stream(image_url, system_prompt)
+        if chunks is None:
+            return None
+        return "".join(chunks)
+
+    def get_description_stream(self, image_url, system_prompt=None):
+        """Yield the description as text chunks while tokens stream in."""
         if self.config is None:
             return None
 
-        base64_image = self.encode_image(imagePath)
-        
+        return self._stream_completion(image_url, system_prompt)
+
+    def _stream_completion(self, image_url, system_prompt):
+        """Generator over text chunks from the Together streaming completion."""
         stream = self.client.chat.completions.create(
             model=self.config["VisionPal"]["model"],
             messages=[
@@ -63,24 +232,16 @@ class VisionDescriber:
                     "role": "user",
                     "content": [
                         {"type": "text", "text": system_prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/jpeg;base64,{base64_image}",
-                            },
-                        },
+                        {"type": "image_url", "image_url": {"url": image_url}},
                     ],
                 }
             ],
             stream=True,
         )
         
-        description = ""
         for chunk in stream:
-            chunk_text = chunk.choices[0].delta.content or "" if chunk.choices else ""
-            description += chunk_text
-            
-        return description
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
     
 def setup_configs():
     """Create default config and .env files if they don't exist."""
@@ -109,97 +270,235 @@ st.set_page_config(page_title="Vision Pal", page_icon="\U0001F441", layout="cent
 
 setup_configs()
 
+# Heavy resources live across reruns: Streamlit re-executes this script on
+# every widget interaction, so anything constructed at module level would
+# otherwise be rebuilt each time (.env read, YAML parse, TLS client, audio
+# device enumeration).
+
+@st.cache_resource
+def get_describer():
+    # .env is read exactly once per server process; production can skip
+    # the file entirely and inject the key through the real environment
+    load_dotenv()
+    api_key = os.getenv("TOGETHER_API_KEY")
+    if not api_key or api_key == "YOUR_TOGETHER_API_KEY_HERE":
+        st.error("`TOGETHER_API_KEY` not found or not set. Please create a `.env` file in the project root and add `TOGETHER_API_KEY='your_key_here'`.")
+        st.stop()
+    return VisionDescriber(api_key)
+
+@st.cache_resource
+def get_tts_engine():
+    import pyttsx3
+    return pyttsx3.init()
+
+@st.cache_resource
+def get_recognizer():
+    import speech_recognition as sr
+    return sr.Recognizer()
+
+@st.cache_resource
+def get_microphone():
+    import speech_recognition as sr
+    return sr.Microphone()
+
+@st.cache_resource
+def get_mic_calibrated():
+    """Calibrate ambient noise once per server process.
+
+    The measured energy threshold is frozen (dynamic adjustment off) and a
+    shorter pause threshold cuts the trailing silence before listen()
+    decides the utterance is over.
+    """
+    r = get_recognizer()
+    with get_microphone() as source:
+        r.adjust_for_ambient_noise(source, duration=1)
+    r.dynamic_energy_threshold = False
+    r.pause_threshold = 0.4
+    return True
+
+@st.cache_resource
+def get_whisper_model():
+    """Load the local Whisper-tiny model once, or None if not installed.
+
+    faster-whisper (CTranslate2, int8) transcribes in real time on a
+    laptop CPU, so recognition stays offline - no round trip to Google's
+    speech endpoint and no network tail latency.
+    """
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError:
+        return None
+    return WhisperModel('tiny', device='cpu', compute_type='int8')
+
+@st.cache_resource
+def get_tts_state():
+    """Shared speaking flag, writable from the TTS worker thread.
+
+    The worker can't touch st.session_state, so reruns read this dict to
+    learn whether audio is still playing.
+    """
+    return {"speaking": False}
+
+@st.cache_resource
+def get_tts_queue():
+    """Start the persistent speaker thread and return its input queue.
+
+    One engine, initialized once, consumes utterances in order - engine
+    init (SAPI5/espeak voice enumeration) no longer runs per utterance,
+    and queued sentences can't talk over each other.
+    """
+    q = queue.Queue()
+    engine = get_tts_engine()
+    state = get_tts_state()
+
+    # One pass over the installed voices (a COM round-trip on SAPI5)
+    # instead of a linear scan per utterance
+    voice_by_lang = {}
+    for voice in engine.getProperty('voices'):
+        if 'Arabic' in voice.name and 'ar' not in voice_by_lang:
+            voice_by_lang['ar'] = voice.id
+        elif 'English' in voice.name and 'en' not in voice_by_lang:
+            voice_by_lang['en'] = voice.id
+
+    def _tts_loop():
+        while True:
+            text, lang = q.get()
+            state["speaking"] = True
+            try:
+                voice_id = voice_by_lang.get(lang)
+                if voice_id is not None:
+                    engine.setProperty('voice', voice_id)
+                engine.say(text)
+                engine.runAndWait()
+            except Exception:
+                pass
+            finally:
+                if q.empty():
+                    state["speaking"] = False
+
+    threading.Thread(target=_tts_loop, daemon=True).start()
+    return q
+
 # Initialize session states
-if 'language' not in st.session_state:
-    st.session_state.language = 'English'
-if 'image_uploaded' not in st.session_state:
-    st.session_state.image_uploaded = False
-if 'tts_engine' not in st.session_state:
-    st.session_state.tts_engine = pyttsx3.init()
-if 'playing_audio' not in st.session_state:
-    st.session_state.playing_audio = False
-if 'temp_image_path' not in st.session_state:
-    st.session_state.temp_image_path = None
-if 'image_data' not in st.session_state:
-    st.session_state.image_data = None
-if 'listening' not in st.session_state:
-    st.session_state.listening = False
-if 'response_text' not in st.session_state:
-    st.session_state.response_text = ""
-if 'asking_question' not in st.session_state:
-    st.session_state.asking_question = False
-if 'ask_method' not in st.session_state:
-    st.session_state.ask_method = None
-if 'followup_question' not in st.session_state:
-    st.session_state.followup_question = ""
-if 'show_text_input' not in st.session_state:
-    st.session_state.show_text_input = False
+# One setdefault sweep instead of a per-key membership check + setattr.
+# The pyttsx3 engine is deliberately absent: it's a cache_resource
+# singleton now, not per-session state.
+_SESSION_DEFAULTS = {
+    'language': 'English',
+    'image_uploaded': False,
+    'playing_audio': False,
+    'image_url': None,
+    'image_html': None,
+    'img_hash': None,
+    'image_data': None,
+    'listening': False,
+    'response_text': "",
+    'asking_question': False,
+    'ask_method': None,
+    'followup_question': "",
+    'show_text_input': False,
+    # Rerun guards: what was last sent to the vision model, so widget
+    # interactions (Stop Talking, language dropdown) don't re-call it
+    'last_processed_question': None,
+    'last_processed_img_hash': None,
+    'use_camera': False,
+    'use_gallery': False,
+}
+for _key, _value in _SESSION_DEFAULTS.items():
+    st.session_state.setdefault(_key, _value)
 
 # Initialize vision model after setup and session state
-describer = VisionDescriber()
+describer = get_describer()
+
+# Re-derive the speaking flag each rerun: the worker thread that finishes
+# an utterance can't clear session_state, so the flag would otherwise
+# stick once set and pin the Speaking banner forever
+st.session_state.playing_audio = (
+    get_tts_state()["speaking"] or not get_tts_queue().empty())
 
 # TTS function with interrupt support
 def speak(text, lang='en'):
-    def _speak():
-        engine = pyttsx3.init()
-        voices = engine.getProperty('voices')
-        for voice in voices:
-            if (lang == 'ar' and 'Arabic' in voice.name) or (lang == 'en' and 'English' in voice.name):
-                engine.setProperty('voice', voice.id)
-                break
-        st.session_state.playing_audio = True
-        engine.say(text)
-        engine.runAndWait()
-        st.session_state.playing_audio = False
-
-    threading.Thread(target=_speak).start()
+    st.session_state.playing_audio = True
+    get_tts_queue().put((text, lang))
 
 # Stop TTS
 def stop_audio():
-    engine = pyttsx3.init()
-    engine.stop()
+    # Drop anything still queued, then cut off the current utterance
+    q = get_tts_queue()
+    while not q.empty():
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            break
+    get_tts_engine().stop()
+    get_tts_state()["speaking"] = False
     st.session_state.playing_audio = False
 
+# Characters that close a sentence (English and Arabic) for streaming TTS
+SENTENCE_ENDINGS = ".!?؟"
+
+def stream_with_tts(chunks, lang):
+    """Relay streamed chunks to the page while speaking finished sentences.
+
+    Feeding this into st.write_stream renders token-by-token, and each
+    completed sentence is handed to speak() so audio starts while later
+    tokens are still being generated.
+    """
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        yield chunk
+        while True:
+            cut = next((i + 1 for i, ch in enumerate(buffer)
+                        if ch in SENTENCE_ENDINGS), None)
+            if cut is None:
+                break
+            sentence = buffer[:cut].strip()
+            buffer = buffer[cut:]
+            if sentence:
+                speak(sentence, lang=lang)
+    if buffer.strip():
+        speak(buffer.strip(), lang=lang)
+
 # Recognize speech
 
 def recognize_speech(lang='en-US'):
     st.session_state.listening = True
-    r = sr.Recognizer()
-    with sr.Microphone() as source:
+    r = get_recognizer()
+    get_mic_calibrated()
+    with get_microphone() as source:
         st.info("🎙️ Listening...")
-        r.adjust_for_ambient_noise(source, duration=1)
         audio = r.listen(source)
     st.session_state.listening = False
+    model = get_whisper_model()
+    if model is not None:
+        try:
+            segments, _ = model.transcribe(
+                io.BytesIO(audio.get_wav_data()),
+                language='ar' if lang.startswith('ar') else 'en',
+                vad_filter=True)
+            return " ".join(seg.text.strip() for seg in segments)
+        except Exception:
+            pass
     try:
         return r.recognize_google(audio, language=lang)
     except:
         return ""
 
 # Title
-st.markdown("""
-    <h1 style='text-align: center;'>
-        <span style="color: #FF5733;">V</span><span style="color: #FFBD33;">i</span><span style="color: #DBFF33;">s</span><span style="color: #75FF33;">i</span><span style="color: #33FF57;">o</span><span style="color: #33FFBD;">n</span>
-        <span style="color: #33DBFF;">P</span><span style="color: #3375FF;">a</span><span style="color: #5733FF;">l</span>
-        <img src="https://img.icons8.com/ios-filled/50/visible.png" width="35" style="vertical-align: middle;"/>
-    </h1>
-""", unsafe_allow_html=True)
+st.markdown(_TITLE_HTML, unsafe_allow_html=True)
 
 # Mic animation
 if st.session_state.playing_audio:
-    st.markdown("<p style='text-align:center;'>🔊 Speaking...</p>", unsafe_allow_html=True)
+    st.markdown(_SPEAKING_HTML, unsafe_allow_html=True)
 elif st.session_state.listening:
-    st.markdown("<p style='text-align:center; animation: pulse 1s infinite;'>🎤 Listening...</p>", unsafe_allow_html=True)
+    st.markdown(_LISTENING_HTML, unsafe_allow_html=True)
 
 # Language selection
 lang_option = st.selectbox("Choose Language / اختر اللغة", ["English", "Arabic"])
 lang = 'ar' if lang_option == 'Arabic' else 'en'
 
-# Image selection logic using session_state flags
-if 'use_camera' not in st.session_state:
-    st.session_state.use_camera = False
-if 'use_gallery' not in st.session_state:
-    st.session_state.use_gallery = False
-
+# Image selection logic uses the use_camera/use_gallery session flags
 col1, col2 = st.columns(2)
 with col1:
     if st.button("Use Camera"):
@@ -216,29 +515,55 @@ if st.session_state.use_camera:
 elif st.session_state.use_gallery:
     image = st.file_uploader("Upload an image", type=['jpg', 'jpeg', 'png'])
 
-# Process image only after it has been received
-if image and not st.session_state.image_uploaded:
-    st.session_state.image_data = image.getvalue()
-    st.image(st.session_state.image_data, caption="Selected Image", use_container_width =True)
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as tmp_file:
-        tmp_file.write(st.session_state.image_data)
-        st.session_state.temp_image_path = tmp_file.name
+# Process image only when its content actually changed: hashing the raw
+# bytes is cheap, and comparing against the last processed hash stops
+# unrelated widget events from re-sending the same image
+if image:
+    raw_bytes = image.getvalue()
+    # BLAKE2b is 2-3x faster than SHA-256 and plenty at cache scale
+    img_hash = hashlib.blake2b(raw_bytes, digest_size=16).hexdigest()
+if image and img_hash != st.session_state.last_processed_img_hash:
+    st.session_state.img_hash = img_hash
+    st.session_state.image_data = shrink_image(raw_bytes)
+    # Encode and build the data URL once, per session: follow-up
+    # questions reuse the cached string, and keeping it here (rather
+    # than on the cross-session describer singleton) means concurrent
+    # sessions can never see each other's image
+    st.session_state.image_url = (
+        "data:image/jpeg;base64,"
+        + encode_image_b64(st.session_state.image_data))
+    # Render via the same inline data URL: Streamlit diffs the markdown
+    # string and skips resending identical HTML on later reruns, where
+    # st.image would re-ship the full image bytes over the WebSocket
+    # every time
+    st.session_state.image_html = (
+        f'<img src="{st.session_state.image_url}" style="width:100%" '
+        'alt="Selected Image"/>'
+    )
 
     prompt = """Describe the most important aspects in the image for a visually impaired individual to help them avoid dangerous situations like crossing roads or obstacles or existing signs to take into concideration, and help them navigate independently — in no more than 30 words."""
     if lang == 'ar':
         prompt = """وصف أهم العناصر في الصورة لمساعدة شخص مكفوف في تجنب المخاطر والعوائق والمشي بأمان دون مساعدة في 30 كلمة أو أقل."""
 
     with st.spinner("Analyzing image, please wait..."):
-        response = describer.get_description(st.session_state.temp_image_path, prompt)
+        response = cached_description(st.session_state.img_hash, prompt, lang)
+        if response is not None:
+            st.success(response)
+            speak(response, lang=lang)
+        else:
+            # write_stream renders token-by-token and returns the full text
+            response = st.write_stream(stream_with_tts(
+                describer.get_description_stream(st.session_state.image_url, prompt),
+                lang))
+            store_description(st.session_state.img_hash, prompt, response, lang)
         st.session_state.response_text = response
-        st.success(response)
-        speak(response, lang=lang)
         st.session_state.image_uploaded = True
+        st.session_state.last_processed_img_hash = img_hash
 
 # Show image again and description
 if st.session_state.image_uploaded:
-    if st.session_state.image_data:
-        st.image(st.session_state.image_data, caption="Selected Image", use_container_width = True)
+    if st.session_state.image_html:
+        st.markdown(st.session_state.image_html, unsafe_allow_html=True)
     st.success(st.session_state.response_text)
 
 # Follow-up question with audio control
@@ -247,6 +572,7 @@ if st.session_state.image_uploaded:
         st.session_state.asking_question = True
         st.session_state.ask_method = None
         st.session_state.followup_question = ""
+        st.session_state.last_processed_question = None
         st.session_state.show_text_input = False
 
 # Step 2: Choose method (radio outside condition with key)
@@ -264,18 +590,31 @@ if st.session_state.asking_question:
 if st.session_state.show_text_input:
     st.session_state.followup_question = st.text_input("Type your question", key="text_input_key")
 
-# Step 5: Process question
-if st.session_state.followup_question:
+# Step 5: Process question (only if it hasn't been answered already -
+# the value persists in session_state, so without the guard every later
+# rerun would hit the vision model again)
+if (st.session_state.followup_question
+        and st.session_state.followup_question != st.session_state.last_processed_question):
     st.write(f"You asked: {st.session_state.followup_question}")
     with st.spinner("Getting answer..."):
-        followup_response = describer.get_description(
-            st.session_state.temp_image_path,
-            st.session_state.followup_question
-        )
+        followup_response = cached_description(
+            st.session_state.img_hash, st.session_state.followup_question, lang)
+        if followup_response is not None:
+            st.success(followup_response)
+            speak(followup_response, lang=lang)
+        else:
+            followup_response = st.write_stream(stream_with_tts(
+                describer.get_description_stream(
+                    st.session_state.image_url,
+                    st.session_state.followup_question
+                ),
+                lang))
+            store_description(st.session_state.img_hash,
+                              st.session_state.followup_question,
+                              followup_response, lang)
         st.session_state.response_text = followup_response
-        st.success(followup_response)
-        speak(followup_response, lang=lang)
         st.markdown("<p style='color: green;'>✅ Analyzed successfully</p>", unsafe_allow_html=True)
+    st.session_state.last_processed_question = st.session_state.followup_question
     st.session_state.asking_question = False
     st.session_state.show_text_input = False
 
@@ -288,10 +627,13 @@ if st.session_state.playing_audio:
 st.markdown("---")
 if st.button("Start Over"):
     st.session_state.image_uploaded = False
-    st.session_state.temp_image_path = None
+    st.session_state.image_url = None
+    st.session_state.image_html = None
     st.session_state.response_text = ""
     st.session_state.image_data = None
     st.session_state.use_camera = False
     st.session_state.use_gallery = False
+    st.session_state.last_processed_question = None
+    st.session_state.last_processed_img_hash = None
     stop_audio()
     st.session_state.listening = False
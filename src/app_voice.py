@@ -1,21 +1,157 @@
 import sys
 import os
 import base64
+import hashlib
+import json
+import mmap
+try:
+    # SIMD-accelerated base64 (AVX2/SSSE3), ~4-10x faster than stdlib
+    import pybase64
+except ImportError:
+    pybase64 = None
+try:
+    # C/SIMD JSON parser for the config sidecar; stdlib json otherwise
+    import orjson
+except ImportError:
+    orjson = None
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, 
                             QVBoxLayout, QHBoxLayout, QWidget, QLabel, 
                             QTextEdit, QFileDialog, QComboBox, QMessageBox)
 from PyQt5.QtGui import QFont, QPixmap, QImage
-from PyQt5.QtCore import Qt, QSize, pyqtSignal, QObject, QTimer
+from PyQt5.QtCore import Qt, QSize, pyqtSignal, QObject, QTimer, QThread
 import cv2
+import numpy as np
 from gtts import gTTS
+import functools
 import tempfile
+import time
 import pygame
 import threading
+import queue
 import yaml
+try:
+    # libyaml C backend - ~10x faster than the pure-Python loader
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 from together import Together
 import speech_recognition as sr
 from dotenv import load_dotenv
 
+# Characters that close a sentence (English and Arabic); used to flush
+# streamed description text to TTS at sentence boundaries
+SENTENCE_ENDINGS = ".!?؟\n"
+
+# Qt < 5.14 has no Format_BGR888; fall back to a cvtColor swap there
+BGR888_FORMAT = getattr(QImage, "Format_BGR888", None)
+
+
+def _bgr_frame_to_qimage(frame):
+    """Build a detached QImage from an OpenCV BGR frame.
+
+    Format_BGR888 wraps the buffer without a colorspace pass where Qt
+    supports it; copy() detaches the result from the numpy buffer so it
+    survives queued signal emits and the next cap.read().
+    """
+    h, w = frame.shape[:2]
+    if BGR888_FORMAT is not None:
+        return QImage(frame.data, w, h, frame.strides[0], BGR888_FORMAT).copy()
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    return QImage(rgb.data, w, h, rgb.strides[0], QImage.Format_RGB888).copy()
+
+# Saved microphone calibration (shared with app_button) so only the
+# first-ever run pays for the ambient-noise measurement
+MIC_SETTINGS_PATH = os.path.join(os.path.expanduser("~"), ".visionpal", "mic.json")
+
+# All spoken/displayed UI strings by language code; handlers look them up
+# through _t() instead of branching on the selected language at each site
+STRINGS = {
+    "en": {
+        "camera_starting": "Starting camera...",
+        "camera_starting_speak": "Starting camera. Say capture when ready",
+        "gallery_opening": "Opening gallery...",
+        "gallery_opening_speak": "Opening gallery",
+        "camera_active": "Camera active - Say 'capture' when ready",
+        "camera_not_active": "Camera not active",
+        "capture_failed": "Failed to capture image",
+        "processing_status": "Processing image...",
+        "captured_processing_speak": "Image captured. Processing...",
+        "selected_processing_speak": "Image selected. Processing...",
+        "no_image_selected": "No image selected",
+        "no_image_available": "No image available",
+        "analyzing_status": "Analyzing image...",
+        "analyzing_wait": "Analyzing image, please wait...",
+    },
+    "ar": {
+        "camera_starting": "تشغيل الكاميرا...",
+        "camera_starting_speak": "تشغيل الكاميرا. قل التقط عندما تكون مستعد",
+        "gallery_opening": "فتح المعرض...",
+        "gallery_opening_speak": "فتح المعرض",
+        "camera_active": "الكاميرا نشطة - قل 'التقط' عندما تكون مستعداً",
+        "camera_not_active": "الكاميرا ليست نشطة",
+        "capture_failed": "فشل في التقاط الصورة",
+        "processing_status": "معالجة الصورة...",
+        "captured_processing_speak": "تم التقاط الصورة. معالجة...",
+        "selected_processing_speak": "تم اختيار الصورة. معالجة...",
+        "no_image_selected": "لم يتم اختيار صورة",
+        "no_image_available": "لا توجد صورة متاحة",
+        "analyzing_status": "تحليل الصورة...",
+        "analyzing_wait": "تحليل الصورة، يرجى الانتظار...",
+    },
+}
+
+
+def _shrink_for_upload(frame, max_side=896, quality=80):
+    """Downscale and JPEG-encode a frame for upload, or None on failure.
+
+    The vision model tiles inputs to ~560 px server-side, so 896 px at
+    quality 80 keeps headroom while shrinking the payload (and its base64)
+    by 4-10x versus a full-resolution quality-95 JPEG.
+    """
+    h, w = frame.shape[:2]
+    scale = max_side / max(h, w)
+    if scale < 1:
+        frame = cv2.resize(frame, (int(w * scale), int(h * scale)),
+                           interpolation=cv2.INTER_AREA)
+    ok, buf = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality,
+                                           cv2.IMWRITE_JPEG_OPTIMIZE, 1])
+    return buf.tobytes() if ok else None
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(config_path, mtime):
+    """Parse the YAML config, memoized by (path, mtime).
+
+    Re-instantiating VisionDescriber no longer pays for the file read and
+    YAML tokenizer; an edit to the file changes the mtime and invalidates
+    the cached entry.
+
+    A JSON sidecar (config.json) handles cold starts: JSON parses 20-50x
+    faster than YAML, and the mtime comparison regenerates the sidecar
+    whenever the YAML is edited.
+    """
+    json_path = os.path.splitext(config_path)[0] + ".json"
+    try:
+        if os.path.getmtime(json_path) >= mtime:
+            with open(json_path, "rb") as f:
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        pass
+    with open(config_path, "r") as f:
+        config = yaml.load(f, Loader=YamlLoader)
+    try:
+        with open(json_path, "wb") as f:
+            if orjson is not None:
+                f.write(orjson.dumps(config))
+            else:
+                f.write(json.dumps(config, ensure_ascii=False).encode("utf-8"))
+    except (OSError, TypeError, ValueError):
+        # Read-only deployments just keep paying the YAML parse
+        pass
+    return config
+
+
 class VisionDescriber:
     def __init__(self, config_path="Configs/config.yml"):
         load_dotenv()
@@ -23,18 +159,58 @@ class VisionDescriber:
         api_key = os.getenv("TOGETHER_API_KEY")
         if not api_key or api_key == "YOUR_TOGETHER_API_KEY_HERE":
             raise ValueError("TOGETHER_API_KEY not found or not set in .env file.")
-        self.client = Together(api_key=api_key)
+        self.client = self._build_client(api_key)
+
+    def _build_client(self, api_key):
+        """Build the Together client on a pooled HTTP/2 session if possible.
+
+        Reusing one keep-alive connection saves a TCP + TLS handshake
+        (~100-300 ms) per image request; httpx.Client is thread-safe, so
+        the processing threads can share it.
+        """
+        try:
+            import httpx
+            http_client = httpx.Client(
+                http2=True,
+                timeout=60.0,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+            return Together(api_key=api_key, http_client=http_client)
+        except (ImportError, TypeError):
+            # Older SDK without http_client support, or httpx/h2 missing
+            return Together(api_key=api_key)
+
+    def warm_up_connection(self):
+        """Prewarm DNS + TCP + TLS with a tiny request (best effort)."""
+        try:
+            self.client.models.list()
+        except Exception:
+            pass
+
+    # Data-URL header, prepended while the payload is still bytes so the
+    # multi-MB base64 body is decoded to str exactly once (the old
+    # bytes -> str -> f-string route copied it twice more)
+    _DATA_URL_PREFIX = b"data:image/jpeg;base64,"
 
     def encode_image(self, image_path):
+        # Memory-map the file: the base64 encoder reads pages straight
+        # from the page cache instead of a read() copy of the whole JPEG
         with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+            mm = mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return self.encode_image_bytes(mm)
+            finally:
+                mm.close()
+
+    def encode_image_bytes(self, image_bytes):
+        """Return a data URL for an in-memory JPEG buffer."""
+        b64encode = pybase64.b64encode if pybase64 is not None else base64.b64encode
+        return (self._DATA_URL_PREFIX + b64encode(image_bytes)).decode('ascii')
 
     def _load_config(self, config_path):
-        """Loads the configuration from the YAML file."""
+        """Loads the configuration from the YAML file (memoized by mtime)."""
         try:
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
-            return config
+            return _load_config_cached(config_path, os.path.getmtime(config_path))
         except FileNotFoundError:
             print(f"Error: config.yml not found at {config_path}")
             return None
@@ -42,22 +218,37 @@ class VisionDescriber:
             print(f"Error parsing config.yml: {e}")
             return None
 
-    def get_description(self, imagePath, system_prompt=None):
+    def get_description(self, imagePath=None, system_prompt=None, image_bytes=None):
         """
         Gets a description of an image using the Together AI Vision model.
 
         Args:
-            image_url (str): URL of the image to describe.
-            user_prompt (str, optional): Additional user prompt. Defaults to None.
+            imagePath (str, optional): Path of the image to describe.
+            system_prompt (str, optional): Additional user prompt. Defaults to None.
+            image_bytes (bytes, optional): In-memory JPEG, used instead of
+                imagePath when given - skips the disk round trip.
 
         Returns:
             str: The description of the image, or None if an error occurs.
         """
+        chunks = self.get_description_stream(imagePath, system_prompt, image_bytes)
+        if chunks is None:
+            return None
+        return "".join(chunks)
+
+    def get_description_stream(self, imagePath=None, system_prompt=None, image_bytes=None):
+        """Yield the description as text chunks while tokens stream in."""
         if self.config is None:
             return None
 
-        base64_image = self.encode_image(imagePath)
-        
+        if image_bytes is not None:
+            image_url = self.encode_image_bytes(image_bytes)
+        else:
+            image_url = self.encode_image(imagePath)
+        return self._stream_completion(image_url, system_prompt)
+
+    def _stream_completion(self, image_url, system_prompt):
+        """Generator over text chunks from the Together streaming completion."""
         stream = self.client.chat.completions.create(
             model=self.config["VisionPal"]["model"],
             messages=[
@@ -68,7 +259,7 @@ class VisionDescriber:
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/jpeg;base64,{base64_image}",
+                                "url": image_url,
                             },
                         },
                     ],
@@ -76,22 +267,71 @@ class VisionDescriber:
             ],
             stream=True,
         )
-        
-        description = ""
+
         for chunk in stream:
-            chunk_text = chunk.choices[0].delta.content or "" if chunk.choices else ""
-            description += chunk_text
-            
-        return description
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
 
 class WorkerSignals(QObject):
     """Define signals for worker thread communication."""
     result = pyqtSignal(str)
+    partial = pyqtSignal(str)
     error = pyqtSignal(str)
     finished = pyqtSignal()
     speech_recognized = pyqtSignal(str)
+
+class CameraWorker(QThread):
+    """Polls the camera off the GUI thread and emits preview frames.
+
+    cap.read() blocks on driver I/O; running it here keeps a stalled read
+    from freezing the UI, and the frame rate follows the camera instead
+    of timer jitter. The newest raw frame is kept in a lock-guarded slot
+    so capture can grab it without competing for the device.
+    """
     frame_ready = pyqtSignal(QImage)
 
+    def __init__(self, cap, target_size=None, parent=None):
+        super().__init__(parent)
+        self.cap = cap
+        self._target_size = target_size
+        self._running = True
+        self._lock = threading.Lock()
+        self._latest = None
+
+    def run(self):
+        while self._running and self.cap.isOpened():
+            ret, frame = self.cap.read()
+            if not ret:
+                continue
+            with self._lock:
+                self._latest = frame
+            # Scale here with SIMD-vectorized INTER_AREA so the GUI thread
+            # only has to paint; aspect ratio is preserved by scaling to
+            # fit the preview slot
+            display = frame
+            if self._target_size is not None:
+                h, w = frame.shape[:2]
+                tw, th = self._target_size
+                scale = min(tw / w, th / h)
+                if scale < 1:
+                    display = cv2.resize(
+                        frame, (int(w * scale), int(h * scale)),
+                        interpolation=cv2.INTER_AREA)
+            # The helper returns a detached copy: the emit is a queued
+            # cross-thread connection and the numpy buffer is recycled on
+            # the next cap.read()
+            self.frame_ready.emit(_bgr_frame_to_qimage(display))
+
+    def latest_frame(self):
+        """Return the most recent raw frame, or None before the first read."""
+        with self._lock:
+            return self._latest
+
+    def stop(self):
+        self._running = False
+        self.wait()
+
+
 class VisionPalApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -100,15 +340,22 @@ class VisionPalApp(QMainWindow):
         
         # Initialize the Vision Describer
         self.vision_describer = self.init_vision_describer()
-        
-        # Store the current image path
+
+        # Warm the TLS session in the background so the first capture
+        # doesn't pay the handshake
+        if self.vision_describer:
+            threading.Thread(
+                target=self.vision_describer.warm_up_connection, daemon=True
+            ).start()
+
+        # Store the current image path (gallery) or in-memory JPEG (camera)
         self.current_image_path = None
+        self.current_image_bytes = None
         
         # Camera variables
         self.camera_active = False
         self.cap = None
-        self.camera_timer = QTimer()
-        self.camera_timer.timeout.connect(self.update_camera_frame)
+        self.camera_worker = None
         
         # Voice control state
         self.voice_state = "waiting_for_start"  # States: waiting_for_start, language_selection, input_method, capturing, processing
@@ -127,17 +374,41 @@ class VisionPalApp(QMainWindow):
         # Set up signal handler
         self.worker_signals = WorkerSignals()
         self.worker_signals.result.connect(self.update_description)
+        self.worker_signals.partial.connect(self.update_partial_description)
         self.worker_signals.error.connect(self.update_error)
         self.worker_signals.speech_recognized.connect(self.process_voice_command)
-        self.worker_signals.frame_ready.connect(self.display_camera_frame)
         
-        # Initialize pygame for audio playback
+        # Initialize pygame for audio playback. Mono 22.05 kHz matches the
+        # TTS output and the 1024-sample buffer starts playback ~50-100 ms
+        # sooner than the 4096 default
+        pygame.mixer.pre_init(frequency=22050, size=-16, channels=1, buffer=1024)
         pygame.mixer.init()
         self.is_playing_audio = False
+
+        # Finished descriptions keyed by (image bytes, language, prompt)
+        # hash: re-describing the same picture skips the vision call, and
+        # synthesized MP3s are kept per utterance so replays skip gTTS too
+        self.description_cache = {}
+        self.tts_cache = {}
+
+        # Sentence queue consumed by the persistent TTS worker: streamed
+        # description sentences and UI prompts play back-to-back in order
+        self.tts_queue = queue.Queue()
+        threading.Thread(target=self._tts_worker_loop, daemon=True).start()
+
+        # Tracks whether streamed text has replaced the "Analyzing..."
+        # placeholder yet
+        self._streaming_started = False
         
         # Initialize speech recognizer
         self.recognizer = sr.Recognizer()
-        
+
+        # Cleared while TTS plays so the background listener doesn't
+        # transcribe the app's own voice (self-feedback triggered spurious
+        # commands and wasted recognition calls)
+        self._listen_enabled = threading.Event()
+        self._listen_enabled.set()
+
         # Start continuous listening
         self.start_continuous_listening()
         
@@ -281,91 +552,226 @@ class VisionPalApp(QMainWindow):
             """)
 
     def start_continuous_listening(self):
-        """Start continuous listening for voice commands."""
-        threading.Thread(target=self._continuous_listening_thread, daemon=True).start()
-    
-    def _continuous_listening_thread(self):
-        """Background thread for continuous speech recognition."""
-        while True:
+        """Start background listening on a single persistent mic stream.
+
+        listen_in_background keeps one PyAudio stream open and calibrates
+        once, instead of reopening the microphone and spending 0.5 s on
+        ambient-noise calibration before every single utterance.
+        """
+        self._microphone = sr.Microphone()
+        saved_threshold = self._load_mic_calibration()
+        if saved_threshold is not None:
+            self.recognizer.energy_threshold = saved_threshold
+        else:
+            with self._microphone as source:
+                self.recognizer.adjust_for_ambient_noise(source, duration=1.0)
+            self._save_mic_calibration(self.recognizer.energy_threshold)
+        # Freeze the measured threshold - dynamic adjustment drifts upward
+        # while the app speaks
+        self.recognizer.dynamic_energy_threshold = False
+        self._stop_listening = self.recognizer.listen_in_background(
+            self._microphone, self._on_audio, phrase_time_limit=5)
+
+    def _load_mic_calibration(self):
+        """Load the persisted mic energy threshold, if any."""
+        try:
+            with open(MIC_SETTINGS_PATH, "r") as f:
+                return json.load(f)["energy_threshold"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _save_mic_calibration(self, energy_threshold):
+        """Persist the mic energy threshold for the next launch."""
+        try:
+            os.makedirs(os.path.dirname(MIC_SETTINGS_PATH), exist_ok=True)
+            with open(MIC_SETTINGS_PATH, "w") as f:
+                json.dump({"energy_threshold": energy_threshold}, f)
+        except OSError:
+            pass
+
+    # Complete command vocabulary of the voice FSM; anything else never
+    # needs the full recognizer
+    _COMMAND_KEYWORDS = ("start", "english", "arabic", "camera", "gallery",
+                         "capture", "stop", "التقط", "كاميرا", "معرض", "توقف")
+
+    def _get_keyword_spotter(self):
+        """Lazily build a restricted-grammar Vosk recognizer (None if unavailable).
+
+        With the grammar limited to the command vocabulary the small model
+        decodes in a few ms, so most audio blobs are classified locally
+        and never reach the heavier recognizers.
+        """
+        if not hasattr(self, "_keyword_spotter"):
             try:
-                with sr.Microphone() as source:
-                    self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                    # Listen for audio with a timeout
-                    audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=5)
-                    
-                # Recognize speech
-                text = self.recognizer.recognize_google(audio, language="en-US")
-                self.worker_signals.speech_recognized.emit(text.lower())
-                
-            except sr.WaitTimeoutError:
-                # Timeout is normal, continue listening
-                continue
-            except sr.UnknownValueError:
-                # Could not understand audio, continue listening
-                continue
-            except sr.RequestError as e:
-                print(f"Speech recognition error: {str(e)}")
-                continue
+                import vosk
+                vosk.SetLogLevel(-1)
+                model = vosk.Model(lang="en-us")
+                grammar = json.dumps(list(self._COMMAND_KEYWORDS) + ["[unk]"])
+                self._keyword_spotter = vosk.KaldiRecognizer(model, 16000, grammar)
+            except Exception:
+                self._keyword_spotter = None
+        return self._keyword_spotter
+
+    def _spot_keyword(self, audio):
+        """Return locally spotted command text, or None to fall through."""
+        spotter = self._get_keyword_spotter()
+        if spotter is None:
+            return None
+        try:
+            raw = audio.get_raw_data(convert_rate=16000, convert_width=2)
+            spotter.AcceptWaveform(raw)
+            text = json.loads(spotter.FinalResult()).get("text", "")
+            if any(word in self._COMMAND_KEYWORDS for word in text.split()):
+                return text
+        except Exception as e:
+            print(f"Keyword spotting error: {str(e)}")
+        return None
+
+    def _get_whisper_model(self):
+        """Lazily load the local faster-whisper model (None if unavailable)."""
+        if not hasattr(self, "_whisper_model"):
+            try:
+                from faster_whisper import WhisperModel
+                self._whisper_model = WhisperModel(
+                    "tiny", device="cpu", compute_type="int8")
+            except Exception:
+                self._whisper_model = None
+        return self._whisper_model
+
+    def _recognize(self, audio):
+        """Transcribe audio locally when possible, else via Google STT.
+
+        The int8 Whisper-tiny model runs in real time on a laptop CPU, so
+        command latency is decode-bound instead of network-bound and
+        recognition keeps working offline.
+        """
+        # Cheap keyword gate first: if the restricted-grammar spotter
+        # already heard a known command, skip the full recognizer
+        spotted = self._spot_keyword(audio)
+        if spotted is not None:
+            return spotted
+
+        model = self._get_whisper_model()
+        if model is not None:
+            try:
+                raw = audio.get_raw_data(convert_rate=16000, convert_width=2)
+                samples = np.frombuffer(raw, np.int16).astype(np.float32) / 32768.0
+                segments, _ = model.transcribe(
+                    samples, language="en", beam_size=1, vad_filter=True)
+                return " ".join(seg.text.strip() for seg in segments)
             except Exception as e:
-                print(f"Error during speech recognition: {str(e)}")
-                continue
-    
+                print(f"Local transcription error: {str(e)}")
+        return self.recognizer.recognize_google(audio, language="en-US")
+
+    def _on_audio(self, recognizer, audio):
+        """Background-listener callback: recognize speech and forward it."""
+        if not self._listen_enabled.is_set():
+            # TTS is playing: don't transcribe the app's own voice, but
+            # stay interruptible - check the audio for the stop command
+            # (cheap local spotter when available, full recognition as a
+            # last resort) and forward only that
+            try:
+                text = self._spot_keyword(audio)
+                if text is None and self._get_keyword_spotter() is None:
+                    text = self._recognize(audio)
+            except Exception:
+                return
+            if text and ("stop" in text.lower() or "توقف" in text):
+                self.worker_signals.speech_recognized.emit(text.lower())
+            return
+        try:
+            text = self._recognize(audio)
+            if text:
+                self.worker_signals.speech_recognized.emit(text.lower())
+        except sr.UnknownValueError:
+            # Could not understand audio, keep listening
+            pass
+        except sr.RequestError as e:
+            print(f"Speech recognition error: {str(e)}")
+        except Exception as e:
+            print(f"Error during speech recognition: {str(e)}")
+
+    # Keyword -> canonical tag, scanned in priority order; Arabic and
+    # English synonyms collapse to one tag so handlers stay language-free
+    _KEYWORD_TAGS = (
+        ("start", "START"),
+        ("english", "ENGLISH"),
+        ("arabic", "ARABIC"),
+        ("camera", "CAMERA"), ("كاميرا", "CAMERA"),
+        ("gallery", "GALLERY"), ("معرض", "GALLERY"),
+        ("capture", "CAPTURE"), ("التقط", "CAPTURE"),
+        ("stop", "STOP"), ("توقف", "STOP"),
+    )
+
     def process_voice_command(self, command):
-        """Process voice commands based on current state."""
+        """Dispatch a recognized utterance via the (state, tag) table."""
         command = command.strip().lower()
-        
-        if self.voice_state == "waiting_for_start":
-            if "start" in command:
-                self.voice_state = "language_selection"
-                self.voice_status.setText("Say 'English' or 'Arabic'")
-                self.statusBar().showMessage("Language selection - Say 'English' or 'Arabic'")
-                self.speak_text("Please say English or Arabic")
-                
-        elif self.voice_state == "language_selection":
-            if "english" in command:
-                self.selected_language = "English"
-                self.voice_state = "input_method"
-                self.voice_status.setText("Say 'camera' or 'gallery'")
-                self.statusBar().showMessage("Input method selection - Say 'camera' or 'gallery'")
-                self.speak_text("Please say camera or gallery")
-            elif "arabic" in command:
-                self.selected_language = "Arabic"
-                self.voice_state = "input_method"
-                self.voice_status.setText("قل 'كاميرا' أو 'معرض'")
-                self.statusBar().showMessage("اختيار طريقة الإدخال - قل 'كاميرا' أو 'معرض'")
-                self.speak_text("الكاميرا أو المعرض؟")
-        
-        elif self.voice_state == "input_method":
-            if "camera" in command or "كاميرا" in command:
-                self.selected_input_method = "camera"
-                if self.selected_language == "Arabic":
-                    self.voice_status.setText("تشغيل الكاميرا...")
-                    self.statusBar().showMessage("تشغيل الكاميرا...")
-                    self.speak_text("تشغيل الكاميرا. قل التقط عندما تكون مستعد")
-                else:
-                    self.voice_status.setText("Starting camera...")
-                    self.statusBar().showMessage("Camera starting...")
-                    self.speak_text("Starting camera. Say capture when ready")
-                self.start_camera_for_capture()
-            elif "gallery" in command or "معرض" in command:
-                self.selected_input_method = "gallery"
-                if self.selected_language == "Arabic":
-                    self.voice_status.setText("فتح المعرض...")
-                    self.statusBar().showMessage("فتح المعرض...")
-                    self.speak_text("فتح المعرض")
-                else:
-                    self.voice_status.setText("Opening gallery...")
-                    self.statusBar().showMessage("Gallery opening...")
-                    self.speak_text("Opening gallery")
-                self.open_gallery_for_voice()
-        
-        elif self.voice_state == "capturing":
-            if "capture" in command or "التقط" in command:
-                self.capture_image_voice()
-        
-        # Handle stop command during audio playback
-        if ("stop" in command or "توقف" in command) and self.is_playing_audio:
+        tags = [tag for kw, tag in self._KEYWORD_TAGS if kw in command]
+
+        for tag in tags:
+            handler = self._COMMAND_DISPATCH.get((self.voice_state, tag))
+            if handler is not None:
+                handler(self)
+                break
+
+        # Handle stop command during audio playback (also between queued
+        # sentences, when nothing is audible but more speech is pending)
+        if "STOP" in tags and (self.is_playing_audio or not self.tts_queue.empty()):
             self.stop_playback()
+
+    def _cmd_start(self):
+        self.voice_state = "language_selection"
+        self.voice_status.setText("Say 'English' or 'Arabic'")
+        self.statusBar().showMessage("Language selection - Say 'English' or 'Arabic'")
+        self.speak_text("Please say English or Arabic")
+
+    def _cmd_select_english(self):
+        self.selected_language = "English"
+        self.voice_state = "input_method"
+        self.voice_status.setText("Say 'camera' or 'gallery'")
+        self.statusBar().showMessage("Input method selection - Say 'camera' or 'gallery'")
+        self.speak_text("Please say camera or gallery")
+
+    def _cmd_select_arabic(self):
+        self.selected_language = "Arabic"
+        self.voice_state = "input_method"
+        self.voice_status.setText("قل 'كاميرا' أو 'معرض'")
+        self.statusBar().showMessage("اختيار طريقة الإدخال - قل 'كاميرا' أو 'معرض'")
+        self.speak_text("الكاميرا أو المعرض؟")
+
+    def _cmd_use_camera(self):
+        self.selected_input_method = "camera"
+        self.voice_status.setText(self._t("camera_starting"))
+        self.statusBar().showMessage(self._t("camera_starting"))
+        self.speak_text(self._t("camera_starting_speak"))
+        self.start_camera_for_capture()
+
+    def _cmd_use_gallery(self):
+        self.selected_input_method = "gallery"
+        self.voice_status.setText(self._t("gallery_opening"))
+        self.statusBar().showMessage(self._t("gallery_opening"))
+        self.speak_text(self._t("gallery_opening_speak"))
+        self.open_gallery_for_voice()
+
+    def _t(self, key):
+        """Look up a UI string for the currently selected language."""
+        lang = (self.available_languages[self.selected_language]["code"]
+                if self.selected_language else "en")
+        return STRINGS[lang][key]
+
+    def _cmd_capture(self):
+        self.capture_image_voice()
+
+    # The voice FSM as data: one lookup replaces the nested if/elif ladder,
+    # and new aliases or states are a table row instead of a new branch
+    _COMMAND_DISPATCH = {
+        ("waiting_for_start", "START"): _cmd_start,
+        ("language_selection", "ENGLISH"): _cmd_select_english,
+        ("language_selection", "ARABIC"): _cmd_select_arabic,
+        ("input_method", "CAMERA"): _cmd_use_camera,
+        ("input_method", "GALLERY"): _cmd_use_gallery,
+        ("capturing", "CAPTURE"): _cmd_capture,
+    }
     
     def start_camera_for_capture(self):
         """Start camera for voice-controlled capture."""
@@ -375,14 +781,25 @@ class VisionPalApp(QMainWindow):
                 self.speak_text("Error: Could not open camera")
                 self.reset_to_start()
                 return
-                
+
+            # Single-frame buffer so cap.read() always returns the newest
+            # frame instead of one queued ~150 ms ago, a preview-sized
+            # resolution so there is little to scale, and MJPG so the
+            # camera ships compressed frames over USB
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+
             self.camera_active = True
             self.voice_state = "capturing"
-            self.camera_timer.start(30)
-            if self.selected_language == "Arabic":
-                self.voice_status.setText("الكاميرا نشطة - قل 'التقط' عندما تكون مستعداً")
-            else:
-                self.voice_status.setText("Camera active - Say 'capture' when ready")
+            self.camera_worker = CameraWorker(
+                self.cap,
+                target_size=(self.image_preview.width(),
+                             self.image_preview.height()))
+            self.camera_worker.frame_ready.connect(self.display_camera_frame)
+            self.camera_worker.start()
+            self.voice_status.setText(self._t("camera_active"))
             
         except Exception as e:
             self.speak_text(f"Camera error: {str(e)}")
@@ -391,44 +808,38 @@ class VisionPalApp(QMainWindow):
     def capture_image_voice(self):
         """Capture image via voice command."""
         if not self.cap or not self.camera_active:
-            if self.selected_language == "Arabic":
-                self.speak_text("الكاميرا ليست نشطة")
-            else:
-                self.speak_text("Camera not active")
+            self.speak_text(self._t("camera_not_active"))
             self.reset_to_start()
             return
             
-        ret, frame = self.cap.read()
-        if not ret:
-            if self.selected_language == "Arabic":
-                self.speak_text("فشل في التقاط الصورة")
-            else:
-                self.speak_text("Failed to capture image")
+        # Grab the newest frame from the worker instead of competing with
+        # it for the device
+        frame = self.camera_worker.latest_frame() if self.camera_worker else None
+        if frame is None:
+            self.speak_text(self._t("capture_failed"))
             self.reset_to_start()
             return
             
-        # Save the captured image to a temporary file
-        temp_dir = tempfile.gettempdir()
-        temp_file = os.path.join(temp_dir, "visionpal_capture.jpg")
-        cv2.imwrite(temp_file, frame)
-        
-        # Store the current image path
-        self.current_image_path = temp_file
-        
+        # Shrink and encode in memory: no JPEG written to disk and read back
+        image_bytes = _shrink_for_upload(frame)
+        if image_bytes is None:
+            self.speak_text(self._t("capture_failed"))
+            self.reset_to_start()
+            return
+
+        self.current_image_bytes = image_bytes
+        self.current_image_path = None
+
         # Stop the camera
         self.stop_camera()
-        
-        # Display the captured image
-        self.display_image(temp_file)
+
+        # Display the captured frame straight from the buffer
+        self.display_captured_frame(frame)
         
         # Process the image
         self.voice_state = "processing"
-        if self.selected_language == "Arabic":
-            self.voice_status.setText("معالجة الصورة...")
-            self.speak_text("تم التقاط الصورة. معالجة...")
-        else:
-            self.voice_status.setText("Processing image...")
-            self.speak_text("Image captured. Processing...")
+        self.voice_status.setText(self._t("processing_status"))
+        self.speak_text(self._t("captured_processing_speak"))
         self.process_image_voice()
     
     def open_gallery_for_voice(self):
@@ -440,76 +851,133 @@ class VisionPalApp(QMainWindow):
         
         if image_path:
             self.current_image_path = image_path
+            # Gallery files are often multi-MP; shrink them for upload the
+            # same way as captures (the preview still shows the original)
+            img = cv2.imread(image_path)
+            if img is not None:
+                self.current_image_bytes = _shrink_for_upload(img)
             self.display_image(image_path)
             self.voice_state = "processing"
-            if self.selected_language == "Arabic":
-                self.voice_status.setText("معالجة الصورة...")
-                self.speak_text("تم اختيار الصورة. معالجة...")
-            else:
-                self.voice_status.setText("Processing image...")
-                self.speak_text("Image selected. Processing...")
+            self.voice_status.setText(self._t("processing_status"))
+            self.speak_text(self._t("selected_processing_speak"))
             self.process_image_voice()
         else:
-            if self.selected_language == "Arabic":
-                self.speak_text("لم يتم اختيار صورة")
-            else:
-                self.speak_text("No image selected")
+            self.speak_text(self._t("no_image_selected"))
             self.reset_to_start()
     
     def process_image_voice(self):
         """Process image with voice control."""
-        if not self.current_image_path:
-            if self.selected_language == "Arabic":
-                self.speak_text("لا توجد صورة متاحة")
-            else:
-                self.speak_text("No image available")
+        if not self.current_image_path and not self.current_image_bytes:
+            self.speak_text(self._t("no_image_available"))
             self.reset_to_start()
             return
-            
+
         prompt = self.available_languages[self.selected_language]["default_prompt"]
-        if self.selected_language == "Arabic":
-            self.statusBar().showMessage("تحليل الصورة...")
-            self.description_text.setText("تحليل الصورة، يرجى الانتظار...")
-        else:
-            self.statusBar().showMessage("Analyzing image...")
-            self.description_text.setText("Analyzing image, please wait...")
+        self.statusBar().showMessage(self._t("analyzing_status"))
+        self.description_text.setText(self._t("analyzing_wait"))
         
         # Run in a separate thread
+        self._streaming_started = False
         threading.Thread(
             target=self._process_image_thread,
-            args=(self.current_image_path, prompt),
+            args=(self.current_image_path, prompt, self.current_image_bytes),
             daemon=True
         ).start()
-    
-    def _process_image_thread(self, image_path, custom_prompt):
-        """Background thread for image processing."""
+
+    def _process_image_thread(self, image_path, custom_prompt, image_bytes=None):
+        """Background thread for image processing.
+
+        Consumes the token stream and flushes complete sentences to the UI
+        and the TTS queue as they finish - the first sentence is spoken
+        while later tokens are still being generated.
+        """
         try:
             if not self.vision_describer:
                 raise Exception("Vision Describer is not initialized")
-                
-            # Get image description
-            description = self.vision_describer.get_description(image_path, custom_prompt)
-            
+
+            cache_key = None
+            if image_bytes is not None:
+                cache_key = self._description_cache_key(image_bytes, custom_prompt)
+                cached = self.description_cache.get(cache_key)
+                if cached is not None:
+                    # Refresh LRU position and replay without a vision call
+                    self.description_cache.pop(cache_key)
+                    self.description_cache[cache_key] = cached
+                    self.worker_signals.partial.emit(cached)
+                    self.tts_queue.put(cached)
+                    self.worker_signals.result.emit(cached)
+                    return
+
+            chunks = self.vision_describer.get_description_stream(
+                image_path, custom_prompt, image_bytes)
+            description = ""
+            buffer = ""
+            if chunks is not None:
+                for chunk in chunks:
+                    description += chunk
+                    buffer += chunk
+                    buffer = self._flush_sentences(buffer)
+            if buffer.strip():
+                self.worker_signals.partial.emit(buffer)
+                self.tts_queue.put(buffer.strip())
+
             if not description:
                 description = "Could not generate description for this image."
-            
+                self.tts_queue.put(description)
+            elif cache_key is not None:
+                if len(self.description_cache) >= self.DESCRIPTION_CACHE_SIZE:
+                    self.description_cache.pop(next(iter(self.description_cache)))
+                self.description_cache[cache_key] = description
+
             # Send the result to the main thread using signals
             self.worker_signals.result.emit(description)
-            
+
         except Exception as e:
             error_msg = f"Error processing image: {str(e)}"
             self.worker_signals.error.emit(error_msg)
-    
+
+    DESCRIPTION_CACHE_SIZE = 64
+
+    def _description_cache_key(self, image_bytes, prompt):
+        """16-byte blake2b over image bytes, language and prompt."""
+        lang = self.selected_language or "English"
+        return hashlib.blake2b(
+            image_bytes + lang.encode() + prompt.encode(),
+            digest_size=16).hexdigest()
+
+    def _flush_sentences(self, buffer):
+        """Emit and enqueue each complete sentence in buffer; return the rest."""
+        while True:
+            cut = next((i + 1 for i, ch in enumerate(buffer)
+                        if ch in SENTENCE_ENDINGS), None)
+            if cut is None:
+                return buffer
+            sentence = buffer[:cut]
+            buffer = buffer[cut:]
+            self.worker_signals.partial.emit(sentence)
+            if sentence.strip():
+                self.tts_queue.put(sentence.strip())
+
+    def update_partial_description(self, text):
+        """Append a streamed sentence to the description as it arrives."""
+        if not self._streaming_started:
+            self.description_text.setText(text)
+            self._streaming_started = True
+        else:
+            # setText left the cursor at the document start; append at the
+            # end so sentences land in order
+            cursor = self.description_text.textCursor()
+            cursor.movePosition(cursor.End)
+            cursor.insertText(text)
+
     def update_description(self, description):
-        """Update UI with the image description and read it aloud."""
+        """Update UI with the full description once streaming completes."""
         self.description_text.setText(description)
         self.voice_status.setText("Analysis complete - Say 'start' to begin again")
         self.statusBar().showMessage("Analysis complete - Say 'start' to begin again")
-        
-        # Read description aloud
-        self.speak_text(description)
-        
-        # Reset to start state after a delay
+
+        # The description was already spoken sentence-by-sentence while
+        # streaming; reset to start state after a delay
         QTimer.singleShot(2000, self.reset_to_start)
     
     def update_error(self, error_msg):
@@ -524,6 +992,7 @@ class VisionPalApp(QMainWindow):
         self.selected_language = None
         self.selected_input_method = None
         self.current_image_path = None
+        self.current_image_bytes = None
         self.voice_status.setText('Say "start" to begin')
         self.statusBar().showMessage("Ready - Say 'start' to begin")
         
@@ -533,34 +1002,28 @@ class VisionPalApp(QMainWindow):
     
     def stop_camera(self):
         """Stop the camera."""
-        self.camera_timer.stop()
+        if self.camera_worker:
+            self.camera_worker.stop()
+            self.camera_worker = None
         if self.cap:
             self.cap.release()
             self.cap = None
         self.camera_active = False
-    
-    def update_camera_frame(self):
-        """Update camera preview frame."""
-        if self.cap and self.cap.isOpened():
-            ret, frame = self.cap.read()
-            if ret:
-                # Convert frame to QImage for display
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = frame_rgb.shape
-                bytes_per_line = ch * w
-                q_image = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
-                self.worker_signals.frame_ready.emit(q_image)
-    
+
     def display_camera_frame(self, q_image):
-        """Display camera frame in UI."""
-        scaled_pixmap = QPixmap.fromImage(q_image).scaled(
-            self.image_preview.width(), 
+        """Display camera frame in UI (already preview-sized by the worker)."""
+        self.image_preview.setPixmap(QPixmap.fromImage(q_image))
+    
+    def display_captured_frame(self, frame):
+        """Display a captured frame without round-tripping through disk."""
+        scaled_pixmap = QPixmap.fromImage(_bgr_frame_to_qimage(frame)).scaled(
+            self.image_preview.width(),
             self.image_preview.height(),
-            Qt.KeepAspectRatio, 
+            Qt.KeepAspectRatio,
             Qt.SmoothTransformation
         )
         self.image_preview.setPixmap(scaled_pixmap)
-    
+
     def display_image(self, image_path):
         """Display the selected image in the UI."""
         pixmap = QPixmap(image_path)
@@ -572,29 +1035,100 @@ class VisionPalApp(QMainWindow):
         )
         self.image_preview.setPixmap(scaled_pixmap)
     
-    def speak_text(self, text):
-        """Convert text to speech and play it."""
+    def _get_offline_tts(self):
+        """Lazily initialize the offline pyttsx3 engine (None if unavailable)."""
+        if not hasattr(self, "_offline_tts"):
+            try:
+                import pyttsx3
+                self._offline_tts = pyttsx3.init()
+            except Exception:
+                self._offline_tts = None
+        return self._offline_tts
+
+    def _speak_offline(self, text, engine):
+        """Synthesize and play text with the local engine (worker thread)."""
         try:
-            # Create a uniquely named temporary file
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp_file:
-                temp_path = tmp_file.name
-            
-            # Get the language code
-            lang_code = self.available_languages[self.selected_language]["code"] if self.selected_language else "en"
-            
-            # Generate speech
+            engine.say(text)
+            engine.runAndWait()
+        except Exception as e:
+            print(f"Offline speech error: {str(e)}")
+
+    def speak_text(self, text):
+        """Queue text for speech; the worker plays utterances in order."""
+        self.tts_queue.put(text)
+
+    def stop_playback(self):
+        """Drop queued speech and cut off the current utterance."""
+        while not self.tts_queue.empty():
+            try:
+                self.tts_queue.get_nowait()
+            except queue.Empty:
+                break
+        pygame.mixer.music.stop()
+        self.is_playing_audio = False
+        self._listen_enabled.set()
+
+    def _tts_worker_loop(self):
+        """Persistent worker: synthesize and play queued utterances in order."""
+        while True:
+            text = self.tts_queue.get()
+            self._listen_enabled.clear()
+            try:
+                self._speak_blocking(text)
+            except Exception as e:
+                print(f"Speech error: {str(e)}")
+            finally:
+                # Re-enable listening only once the queue is drained, so
+                # back-to-back sentences stay gated as one utterance
+                if self.tts_queue.empty():
+                    self._listen_enabled.set()
+
+    def _speak_blocking(self, text):
+        """Synthesize text and play it to completion (TTS worker thread)."""
+        # Get the language code
+        lang_code = self.available_languages[self.selected_language]["code"] if self.selected_language else "en"
+
+        # Short English prompts ("Please say camera or gallery") synthesize
+        # locally - no Google round trip, no temp file, audio starts
+        # immediately. gTTS stays for Arabic (system voices are rarely
+        # installed) and for long descriptions where its quality is better.
+        if lang_code == "en" and len(text) < 120:
+            engine = self._get_offline_tts()
+            if engine is not None:
+                self._speak_offline(text, engine)
+                return
+
+        # Deterministic per-utterance file: repeats of the same sentence
+        # (UI prompts, replayed descriptions) reuse the MP3 instead of
+        # hitting gTTS again
+        key = hashlib.blake2b(
+            (lang_code + "\x00" + text).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        temp_path = self.tts_cache.get(key)
+        if temp_path is not None and os.path.exists(temp_path):
+            # Refresh LRU position
+            self.tts_cache.pop(key)
+            self.tts_cache[key] = temp_path
+        else:
+            temp_path = os.path.join(
+                tempfile.gettempdir(),
+                f"visionpal_tts_{os.getpid()}_{key}.mp3")
             tts = gTTS(text=text, lang=lang_code, slow=False)
             tts.save(temp_path)
-            
-            # Play the audio
-            pygame.mixer.music.load(temp_path)
-            pygame.mixer.music.play()
-            
-            # Set up a timer to delete the file after playback completes
-            QTimer.singleShot(10000, lambda: self.cleanup_temp_file(temp_path))
-            
-        except Exception as e:
-            print(f"Speech error: {str(e)}")
+            if len(self.tts_cache) >= self.TTS_CACHE_SIZE:
+                evicted_key = next(iter(self.tts_cache))
+                self.cleanup_temp_file(self.tts_cache.pop(evicted_key))
+            self.tts_cache[key] = temp_path
+
+        # Play the audio and wait so queued sentences don't overlap
+        pygame.mixer.music.load(temp_path)
+        pygame.mixer.music.play()
+        self.is_playing_audio = True
+        while pygame.mixer.music.get_busy():
+            time.sleep(0.05)
+        self.is_playing_audio = False
+
+    TTS_CACHE_SIZE = 32
 
     def cleanup_temp_file(self, file_path):
         """Clean up temporary audio file."""
@@ -604,6 +1138,12 @@ class VisionPalApp(QMainWindow):
         except:
             pass
 
+    def closeEvent(self, event):
+        """Sweep cached TTS files on exit."""
+        for file_path in self.tts_cache.values():
+            self.cleanup_temp_file(file_path)
+        super().closeEvent(event)
+
 def create_config_directory():
     """Create the Configs directory and default config file if they don't exist."""
     # Create Configs directory if it doesn't exist